@@ -3,12 +3,22 @@ Generate ASCII and Mermaid ER diagrams for the crypto data pipeline.
 Run this to get different diagram formats for documentation.
 """
 
-def print_ascii_diagram():
-    """Print ASCII art ER diagram."""
-    diagram = """
-╔═══════════════════════════════════════════════════════════════════════════════╗
+import sys
+
+_RULE = "=" * 80
+
+# Frame fragments shared by several diagrams, defined once and spliced in below
+_BOX_RULE = "═" * 79
+_BOX_TOP = f"╔{_BOX_RULE}╗\n"
+_BOX_BOTTOM = f"╚{_BOX_RULE}╝\n"
+_FRAME_RULE = "─" * 73
+_FRAME_TOP = f"┌{_FRAME_RULE}┐\n"
+_FRAME_BOTTOM = f"└{_FRAME_RULE}┘\n"
+
+
+_ASCII_DIAGRAM = "\n" + _BOX_TOP + """\
 ║                    CRYPTO DATA PIPELINE - ER DIAGRAM (3NF)                     ║
-╚═══════════════════════════════════════════════════════════════════════════════╝
+""" + _BOX_BOTTOM + """\
 
 ┌─────────────────────────────────┐
 │   INGESTION_BATCHES             │
@@ -84,9 +94,9 @@ def print_ascii_diagram():
 │    created_at (TIMESTAMP)       │
 └─────────────────────────────────┘
 
-╔═══════════════════════════════════════════════════════════════════════════════╗
+""" + _BOX_TOP + """\
 ║                              KEY RELATIONSHIPS                                 ║
-╚═══════════════════════════════════════════════════════════════════════════════╝
+""" + _BOX_BOTTOM + """\
 
 1. INGESTION_BATCHES → CRYPTOCURRENCIES (1:N implicit)
    - Batches track when cryptos were discovered/updated
@@ -104,9 +114,9 @@ def print_ascii_diagram():
    - Foreign Key: market_metrics.snapshot_id → price_snapshots.snapshot_id
    - Unique constraint ensures 1:1 relationship
 
-╔═══════════════════════════════════════════════════════════════════════════════╗
+""" + _BOX_TOP + """\
 ║                              NORMALIZATION (3NF)                               ║
-╚═══════════════════════════════════════════════════════════════════════════════╝
+""" + _BOX_BOTTOM + """\
 
 ✅ 1NF: All attributes are atomic (no arrays or nested structures)
 ✅ 2NF: No partial dependencies (all non-key attributes depend on entire PK)
@@ -118,9 +128,9 @@ Separation Rationale:
 - MARKET_METRICS: Market-specific metrics (separated for clarity and flexibility)
 - INGESTION_BATCHES: Audit trail (completely independent lifecycle)
 
-╔═══════════════════════════════════════════════════════════════════════════════╗
+""" + _BOX_TOP + """\
 ║                              DEDUPLICATION                                     ║
-╚═══════════════════════════════════════════════════════════════════════════════╝
+""" + _BOX_BOTTOM + """\
 
 🔒 CRYPTOCURRENCIES: UPSERT on crypto_id (updates metadata, no duplicates)
 🔒 PRICE_SNAPSHOTS: Unique (crypto_id, snapshot_time) - time-bucketed to 5min
@@ -128,17 +138,11 @@ Separation Rationale:
 🔒 INGESTION_BATCHES: No deduplication (every event is unique for audit)
 
 📊 Storage Savings: ~80% reduction through time-bucketing deduplication
+
 """
-    print(diagram)
 
 
-def print_mermaid_diagram():
-    """Print Mermaid.js ER diagram syntax."""
-    print("\n" + "="*80)
-    print("MERMAID DIAGRAM (paste into Mermaid Live Editor: https://mermaid.live)")
-    print("="*80 + "\n")
-    
-    mermaid = """erDiagram
+_MERMAID_DIAGRAM = """erDiagram
     INGESTION_BATCHES ||--o{ PRICE_SNAPSHOTS : creates
     CRYPTOCURRENCIES ||--o{ PRICE_SNAPSHOTS : has
     PRICE_SNAPSHOTS ||--|| MARKET_METRICS : contains
@@ -198,20 +202,13 @@ def print_mermaid_diagram():
         decimal roi_percentage
         timestamp created_at
     }
+
 """
-    print(mermaid)
 
 
-def print_data_flow():
-    """Print data flow diagram."""
-    print("\n" + "="*80)
-    print("DATA FLOW DIAGRAM")
-    print("="*80 + "\n")
-    
-    flow = """
-┌─────────────────────────────────────────────────────────────────────────┐
+_FLOW_DIAGRAM = "\n" + _FRAME_TOP + """\
 │                         DATA INGESTION FLOW                              │
-└─────────────────────────────────────────────────────────────────────────┘
+""" + _FRAME_BOTTOM + """\
 
     ┌─────────────────┐
     │  CoinGecko API  │
@@ -294,20 +291,13 @@ def print_data_flow():
     │  • Custom SQL queries                   │
     │  • BI tools (Grafana, Metabase, etc.)   │
     └─────────────────────────────────────────┘
+
 """
-    print(flow)
 
 
-def print_deduplication_flow():
-    """Print deduplication logic flow."""
-    print("\n" + "="*80)
-    print("DEDUPLICATION FLOW")
-    print("="*80 + "\n")
-    
-    dedup = """
-┌─────────────────────────────────────────────────────────────────────────┐
+_DEDUP_DIAGRAM = "\n" + _FRAME_TOP + """\
 │                    TIME-BUCKETING DEDUPLICATION                          │
-└─────────────────────────────────────────────────────────────────────────┘
+""" + _FRAME_BOTTOM + """\
 
 Input: Bitcoin price @ 2025-12-26 10:03:47
                 │
@@ -365,16 +355,37 @@ Time        Ingestion               Snapshot Time      Action
 10:07:50    Bitcoin @ $87,350  →    10:10:00           ✅ INSERT
 
 Result: 5 ingestions → 3 unique snapshots (60% deduplication rate)
+
 """
-    print(dedup)
+
+
+_FOOTER = f"\n{_RULE}\n✅ All diagrams generated successfully!\n{_RULE}\n"
+
+# (banner title, body) pairs in output order; the ER diagram is emitted without a banner
+_DIAGRAMS = [
+    (None, _ASCII_DIAGRAM),
+    ("MERMAID DIAGRAM (paste into Mermaid Live Editor: https://mermaid.live)", _MERMAID_DIAGRAM),
+    ("DATA FLOW DIAGRAM", _FLOW_DIAGRAM),
+    ("DEDUPLICATION FLOW", _DEDUP_DIAGRAM),
+]
+
+
+def render_all():
+    """Return every diagram, with section banners and footer, as one string."""
+    parts = []
+    for title, body in _DIAGRAMS:
+        if title:
+            parts.append(f"\n{_RULE}\n{title}\n{_RULE}\n\n")
+        parts.append(body)
+    parts.append(_FOOTER)
+    return "".join(parts)
+
+
+# Rendered and UTF-8 encoded once so __main__ emits the whole document in a
+# single binary write, bypassing TextIOWrapper's per-call encoding.
+_ALL_BYTES = render_all().encode("utf-8")
 
 
 if __name__ == "__main__":
-    print_ascii_diagram()
-    print_mermaid_diagram()
-    print_data_flow()
-    print_deduplication_flow()
-    
-    print("\n" + "="*80)
-    print("✅ All diagrams generated successfully!")
-    print("="*80)
+    sys.stdout.buffer.write(_ALL_BYTES)
+    sys.stdout.buffer.flush()
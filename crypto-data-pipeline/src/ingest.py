@@ -1,13 +1,32 @@
-import json
+import functools
+import gzip
+import logging
 import os
+import shutil
 import time
-from datetime import datetime
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from urllib.parse import urlencode
 
-import requests
+if TYPE_CHECKING:
+    import requests
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
 
 API_URL = "https://api.coingecko.com/api/v3/coins/markets"
 API_KEY_ENV_VAR = "COINGECKO_API_KEY"
+COMPRESS_ENV_VAR = "LANDING_ZONE_GZIP"
+PAGES_ENV_VAR = "COINGECKO_PAGES"
+
+MAX_FETCH_WORKERS = 8
+
+MAX_RETRIES = 3
+RETRY_BACKOFF = 5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
 
 PARAMS = {
     "vs_currency": "usd",
@@ -17,8 +36,31 @@ PARAMS = {
     "page": 1
 }
 
-OUTPUT_DIR = Path("landing_zone")
-OUTPUT_FILE = OUTPUT_DIR / "crypto_prices_sample.json"
+# Paged runs (COINGECKO_PAGES > 1) walk the market-cap ranking rather than the
+# pinned ids, which would leave every page after the first empty
+PAGED_PARAMS = {
+    "vs_currency": "usd",
+    "order": "market_cap_desc",
+    "per_page": 250,
+}
+
+# Neither dict changes at runtime, so encode the query strings once at import
+_FULL_URL = f"{API_URL}?{urlencode(PARAMS)}"
+_PAGED_URL_PREFIX = f"{API_URL}?{urlencode(PAGED_PARAMS)}&page="
+
+OUTPUT_DIR = "landing_zone"
+OUTPUT_FILE = os.path.join(OUTPUT_DIR, "crypto_prices_sample.json")
+GZIP_LEVEL = 6
+
+# Static pieces of the landing-zone envelope; only ingested_at and the records vary per run
+_ENVELOPE_PREFIX = b'{\n  "ingested_at": "'
+_ENVELOPE_MID = b'",\n  "source": "CoinGecko",\n  "records": '
+_ENVELOPE_SUFFIX = b'\n}\n'
+
+
+def landing_file() -> str:
+    """Return the landing-zone file written by this run, honouring LANDING_ZONE_GZIP."""
+    return OUTPUT_FILE + ".gz" if os.getenv(COMPRESS_ENV_VAR) else OUTPUT_FILE
 
 
 def _build_headers() -> dict:
@@ -30,48 +72,131 @@ def _build_headers() -> dict:
     return {"x-cg-pro-api-key": api_key}
 
 
-def fetch_crypto_data(retries=3, backoff=5):
-    for attempt in range(retries):
-        try:
-            response = requests.get(
-                API_URL,
-                params=PARAMS,
-                headers=_build_headers(),
-                timeout=10,
-            )
-
-            if response.status_code == 200:
-                return response.json()
-
-            if response.status_code == 429:
-                print("⚠️ Rate limit hit. Retrying...")
-                time.sleep(backoff)
-                continue
-
-            response.raise_for_status()
-
-        except Exception as e:
-            print(f"Attempt {attempt + 1} failed: {e}")
-            time.sleep(backoff)
-
-    raise Exception("Failed after multiple retries")
+@functools.lru_cache(maxsize=1)
+def _get_session() -> "requests.Session":
+    """Return a session whose pooled connections are reused across attempts and pages.
+
+    requests/urllib3 are imported here rather than at module level so that
+    importing this module (e.g. for OUTPUT_FILE) stays cheap. The API key
+    header is read once, when the session is built; call
+    ``_get_session.cache_clear()`` after rotating the key.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    class LoggingRetry(Retry):
+        """Retry policy that reports each failed attempt (urllib3 logs retries only at DEBUG)."""
+
+        def increment(self, method=None, url=None, response=None, error=None, *args, **kwargs):
+            if error is not None:
+                reason = error
+            elif response is not None and response.status == 429:
+                reason = "rate limit hit (HTTP 429)"
+            elif response is not None:
+                reason = f"HTTP {response.status}"
+            else:
+                reason = "unknown error"
+            logger.warning("Attempt %d failed: %s", len(self.history) + 1, reason)
+            return super().increment(method, url, response, error, *args, **kwargs)
+
+    # urllib3 handles exponential backoff and honours Retry-After on 429/503
+    retry = LoggingRetry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF / 2,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=("GET",),
+        respect_retry_after_header=True,
+    )
+    session = requests.Session()
+    session.headers.update(_build_headers())
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=1, pool_maxsize=MAX_FETCH_WORKERS, max_retries=retry),
+    )
+    return session
+
+
+def fetch_crypto_data() -> "requests.Response":
+    """Open a streamed market data response, retrying transient failures via the session adapter."""
+    response = _get_session().get(_FULL_URL, timeout=10, stream=True)
+    # Only enter raise_for_status (reason decoding, message formatting) on failure
+    if response.status_code >= 400:
+        response.close()
+        response.raise_for_status()
+    # Let urllib3 undo any gzip/deflate transfer encoding while streaming raw bytes
+    response.raw.decode_content = True
+    return response
+
+
+def _fetch_page(session: "requests.Session", url: str) -> bytes:
+    """Fetch one page of market data as the raw JSON array body."""
+    response = session.get(url, timeout=10)
+    if response.status_code >= 400:
+        response.raise_for_status()
+    return response.content
+
+
+def fetch_all_pages(pages: int) -> bytes:
+    """Fetch pages 1..pages concurrently and merge them into a single JSON array."""
+    # HTTP I/O releases the GIL, so threads overlap the round-trips on one shared session
+    fetch_page = functools.partial(_fetch_page, _get_session())
+    urls = [f"{_PAGED_URL_PREFIX}{page}" for page in range(1, pages + 1)]
+    with ThreadPoolExecutor(max_workers=min(pages, MAX_FETCH_WORKERS)) as executor:
+        bodies = list(executor.map(fetch_page, urls))
+    # Each body is a JSON array; splice the elements together without parsing them
+    items = [body.strip()[1:-1].strip() for body in bodies]
+    return b"[" + b",".join(item for item in items if item) + b"]"
 
 
 def main():
-    OUTPUT_DIR.mkdir(exist_ok=True)
-
-    data = fetch_crypto_data()
-
-    payload = {
-        "ingested_at": datetime.utcnow().isoformat(),
-        "source": "CoinGecko",
-        "records": data
-    }
-
-    with open(OUTPUT_FILE, "w") as f:
-        json.dump(payload, f, indent=2)
-
-    print(f"✅ Data saved to {OUTPUT_FILE}")
+    # stat() is served from the dentry cache; only fall back to mkdir() on first run
+    try:
+        os.stat(OUTPUT_DIR)
+    except FileNotFoundError:
+        os.makedirs(OUTPUT_DIR)
+
+    # Repeated per-coin keys make the payload highly compressible; opt in via env var
+    output_file = landing_file()
+    if output_file.endswith(".gz"):
+        stale_file = OUTPUT_FILE
+        opener = functools.partial(gzip.open, compresslevel=GZIP_LEVEL)
+    else:
+        stale_file = OUTPUT_FILE + ".gz"
+        opener = open
+    temp_file = output_file + ".tmp"
+
+    pages = int(os.getenv(PAGES_ENV_VAR, 1))
+
+    # Stream the API body straight into the envelope instead of parsing and re-serialising it.
+    # Writes go to a temp file that is renamed into place, so load_data never sees a partial file.
+    try:
+        with opener(temp_file, "wb") as f:
+            ingested_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+            f.write(_ENVELOPE_PREFIX)
+            f.write(ingested_at.encode("ascii"))
+            f.write(_ENVELOPE_MID)
+            if pages > 1:
+                f.write(fetch_all_pages(pages))
+            else:
+                with fetch_crypto_data() as response:
+                    shutil.copyfileobj(response.raw, f, length=65536)
+            f.write(_ENVELOPE_SUFFIX)
+        os.replace(temp_file, output_file)
+    except BaseException:
+        try:
+            os.remove(temp_file)
+        except FileNotFoundError:
+            pass
+        raise
+
+    # Drop the other format's file so load_directory never reloads a stale copy
+    try:
+        os.remove(stale_file)
+    except FileNotFoundError:
+        pass
+
+    logger.info("Data saved to %s", output_file)
 
 
 if __name__ == "__main__":
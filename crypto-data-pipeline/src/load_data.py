@@ -7,19 +7,37 @@ Features:
 - Transforms nested JSON into normalized 3NF schema
 - Implements deduplication strategy for time-series data
 - Applies data quality validation before loading
+- Bulk-loads each batch through COPY into temporary staging tables
 - Handles database transactions for data integrity
 - Supports both single file and batch processing
 """
 
+import csv
+import functools
+import gzip
+import io
 import json
 import logging
 import os
-from datetime import datetime
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from itertools import chain, islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
 
 import psycopg2
 
+from ingest import landing_file
+
+try:
+    # Optional C parser; falls back to the stdlib when orjson is not installed
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -27,24 +45,148 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# When set, batch commits do not wait for the WAL flush (synchronous_commit=off)
+FAST_COMMIT_ENV_VAR = 'CRYPTO_LOADER_FAST_COMMIT'
+
+# load_directory stages fewer files than this in-process (worker start-up costs
+# more than parsing a few small files), and keeps at most this many files per
+# worker staged ahead of the database load
+MIN_PARALLEL_FILES = 4
+MAX_PENDING_PER_WORKER = 2
+
+# Column order of the row tuples staged for each target table
+CRYPTO_COLUMNS = ('crypto_id', 'symbol', 'name', 'image_url')
+# batch_id is not staged: it is bound as a parameter when the snapshots are merged
+SNAPSHOT_COLUMNS = (
+    'crypto_id', 'current_price', 'high_24h', 'low_24h',
+    'price_change_24h', 'price_change_pct_24h',
+    'ath', 'ath_change_pct', 'ath_date',
+    'atl', 'atl_change_pct', 'atl_date',
+    'last_updated', 'snapshot_time',
+)
+METRICS_COLUMNS = (
+    'market_cap', 'market_cap_rank',
+    'fully_diluted_valuation', 'total_volume',
+    'market_cap_change_24h', 'market_cap_change_pct_24h',
+    'circulating_supply', 'total_supply', 'max_supply',
+    'roi_times', 'roi_currency', 'roi_percentage',
+)
+# market_metrics rows are staged by crypto_id until their snapshot_id is known
+METRICS_STAGE_COLUMNS = ('crypto_id',) + METRICS_COLUMNS
+
+# Session-scoped staging tables as (name, relation supplying column types, columns).
+# ON COMMIT DELETE ROWS empties them after every batch, so they are created once
+# per connection and the prepared statements below can reference them.
+STAGING_TABLES = (
+    ('stg_cryptocurrencies', 'cryptocurrencies', CRYPTO_COLUMNS),
+    ('stg_price_snapshots', 'price_snapshots', SNAPSHOT_COLUMNS),
+    (
+        'stg_market_metrics',
+        'price_snapshots JOIN market_metrics USING (snapshot_id)',
+        METRICS_STAGE_COLUMNS,
+    ),
+)
+
+CREATE_BATCH_SQL = """
+    INSERT INTO ingestion_batches (ingested_at, source, record_count, status)
+    VALUES ($1, $2, $3, 'pending')
+    RETURNING batch_id;
+"""
+
+UPSERT_CRYPTOCURRENCIES_SQL = f"""
+    INSERT INTO cryptocurrencies ({', '.join(CRYPTO_COLUMNS)})
+    SELECT {', '.join(CRYPTO_COLUMNS)} FROM stg_cryptocurrencies
+    ON CONFLICT (crypto_id) 
+    DO UPDATE SET
+        symbol = EXCLUDED.symbol,
+        name = EXCLUDED.name,
+        image_url = EXCLUDED.image_url,
+        updated_at = CURRENT_TIMESTAMP;
+"""
+
+# Snapshots that hit the (crypto_id, snapshot_time) constraint are skipped, and
+# only the snapshots actually inserted receive market metrics. Returns the
+# crypto_id of every inserted snapshot.
+INSERT_SNAPSHOTS_AND_METRICS_SQL = f"""
+    WITH inserted AS (
+        INSERT INTO price_snapshots (batch_id, {', '.join(SNAPSHOT_COLUMNS)})
+        SELECT $1, {', '.join(SNAPSHOT_COLUMNS)} FROM stg_price_snapshots
+        ON CONFLICT (crypto_id, snapshot_time) DO NOTHING
+        RETURNING snapshot_id, crypto_id
+    ), metrics AS (
+        INSERT INTO market_metrics (snapshot_id, {', '.join(METRICS_COLUMNS)})
+        SELECT i.snapshot_id, {', '.join('m.' + c for c in METRICS_COLUMNS)}
+        FROM inserted i
+        JOIN stg_market_metrics m USING (crypto_id)
+    )
+    SELECT crypto_id FROM inserted;
+"""
+
+# NULL marker for staged CSV; csv.writer writes None and '' identically, and
+# COPY's CSV default would load both as NULL
+_COPY_NULL = '\\N'
+
+# Statements prepared once per session as (name, parameter types, SQL), so each
+# batch only sends bind parameters instead of re-parsing and re-planning the SQL
+PREPARED_STATEMENTS = (
+    ('create_batch', '(timestamp, varchar, integer)', CREATE_BATCH_SQL),
+    ('upsert_cryptocurrencies', '', UPSERT_CRYPTOCURRENCIES_SQL),
+    ('insert_snapshots_and_metrics', '(integer)', INSERT_SNAPSHOTS_AND_METRICS_SQL),
+)
+
+
+# Fields checked by validate_record: required non-empty strings, then
+# magnitudes that may be zero but never negative (current_price must be > 0)
+_REQUIRED_STRINGS = ('id', 'symbol', 'name')
+_NONNEG_FIELDS = (
+    'high_24h',
+    'low_24h',
+    'ath',
+    'atl',
+    'market_cap',
+    'fully_diluted_valuation',
+    'total_volume',
+    'circulating_supply',
+    'total_supply',
+    'max_supply',
+)
+
 
 class DataQualityError(Exception):
     """Raised when an inbound record fails data quality checks."""
 
 
-def _validate_positive(value, field_name, allow_zero=True):
-    """Ensure numeric value is non-negative (or strictly positive when required)."""
-    if value is None:
-        return
-    if value < 0 or (not allow_zero and value == 0):
-        raise DataQualityError(f"{field_name} has invalid value {value}")
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts the trailing 'Z' natively; bind it directly so
+    # parsing costs no extra Python frame or string copy per timestamp
+    _parse_iso_timestamp = datetime.fromisoformat
+else:
+    def _parse_iso_timestamp(value: str) -> datetime:
+        """Parse an ISO-8601 timestamp, accepting a trailing 'Z' for UTC."""
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
 
 
-def _validate_required_strings(record: Dict, fields: List[str]):
-    """Ensure required string fields exist and are non-empty."""
-    for field in fields:
-        if not record.get(field):
+def _as_bigint(value):
+    """Round float magnitudes destined for BIGINT columns (COPY does not cast them)."""
+    return round(value) if isinstance(value, float) else value
+
+
+def validate_record(record: Dict):
+    """Validate inbound record for data quality compliance."""
+    get = record.get
+    for field in _REQUIRED_STRINGS:
+        if not get(field):
             raise DataQualityError(f"Missing required field '{field}'")
+    price = get('current_price')
+    if price is not None and price <= 0:
+        raise DataQualityError(f"current_price has invalid value {price}")
+    for field in _NONNEG_FIELDS:
+        value = get(field)
+        if value is not None and value < 0:
+            raise DataQualityError(f"{field} has invalid value {value}")
+    rank = get('market_cap_rank')
+    if rank is not None and rank <= 0:
+        raise DataQualityError(f"market_cap_rank must be greater than zero (found {rank})")
 
 
 class CryptoDataLoader:
@@ -75,10 +217,23 @@ class CryptoDataLoader:
             self.conn = psycopg2.connect(**self.conn_params)
             self.cursor = self.conn.cursor()
             logger.info("Database connection established")
+            self._prepare_session()
         except psycopg2.Error as e:
             logger.error(f"Failed to connect to database: {e}")
             raise
     
+    def _prepare_session(self):
+        """Create session-scoped staging tables and prepare the batch statements."""
+        for staging, source, columns in STAGING_TABLES:
+            # WITH NO DATA copies column types but not NOT NULL/CHECK constraints
+            self.cursor.execute(
+                f"CREATE TEMP TABLE {staging} ON COMMIT DELETE ROWS AS "
+                f"SELECT {', '.join(columns)} FROM {source} WITH NO DATA;"
+            )
+        for name, param_types, query in PREPARED_STATEMENTS:
+            self.cursor.execute(f"PREPARE {name} {param_types} AS {query}")
+        self.conn.commit()
+    
     def disconnect(self):
         """Close database connection."""
         if self.cursor:
@@ -100,14 +255,20 @@ class CryptoDataLoader:
                 logger.error("Transaction rolled back due to error")
         self.disconnect()
     
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
     def round_to_snapshot_interval(
-        self, 
         timestamp: datetime, 
         interval_minutes: int = 5
     ) -> datetime:
         """
         Round timestamp to nearest interval for deduplication.
         
+        Memoized per process; it only hits when the same ingested_at is
+        staged again in that process (e.g. a file reloaded by
+        load_json_file), as ingest stamps each run to the second and
+        load_directory workers each keep their own cache.
+        
         Args:
             timestamp: Original timestamp
             interval_minutes: Rounding interval in minutes
@@ -115,12 +276,15 @@ class CryptoDataLoader:
         Returns:
             Rounded timestamp
         """
-        # Use database function for consistency
-        query = """
-            SELECT round_to_snapshot_interval(%s::TIMESTAMP, %s);
-        """
-        self.cursor.execute(query, (timestamp, interval_minutes))
-        return self.cursor.fetchone()[0]
+        # Mirrors the SQL round_to_snapshot_interval() function in
+        # create_tables.sql without a server round-trip: truncate to the hour,
+        # then add the minute count rounded half-up to the interval (seconds
+        # are ignored, as EXTRACT(MINUTE ...) ignores them).
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+        hour = timestamp.replace(minute=0, second=0, microsecond=0)
+        buckets = (2 * timestamp.minute + interval_minutes) // (2 * interval_minutes)
+        return hour + timedelta(minutes=buckets * interval_minutes)
     
     def create_ingestion_batch(
         self, 
@@ -139,171 +303,179 @@ class CryptoDataLoader:
         Returns:
             batch_id
         """
-        query = """
-            INSERT INTO ingestion_batches (ingested_at, source, record_count, status)
-            VALUES (%s, %s, %s, 'pending')
-            RETURNING batch_id;
-        """
-        self.cursor.execute(query, (ingested_at, source, record_count))
+        self.cursor.execute(
+            "EXECUTE create_batch (%s, %s, %s);", (ingested_at, source, record_count)
+        )
         batch_id = self.cursor.fetchone()[0]
         logger.info(f"Created ingestion batch {batch_id}")
         return batch_id
     
-    def upsert_cryptocurrency(self, record: Dict) -> str:
+    @staticmethod
+    def _crypto_row(record: Dict) -> Tuple:
         """
-        Insert or update cryptocurrency master data.
+        Build a cryptocurrencies row from an API record.
         
         Args:
             record: Cryptocurrency data from API
             
         Returns:
-            crypto_id
-        """
-        query = """
-            INSERT INTO cryptocurrencies (crypto_id, symbol, name, image_url)
-            VALUES (%s, %s, %s, %s)
-            ON CONFLICT (crypto_id) 
-            DO UPDATE SET
-                symbol = EXCLUDED.symbol,
-                name = EXCLUDED.name,
-                image_url = EXCLUDED.image_url,
-                updated_at = CURRENT_TIMESTAMP
-            RETURNING crypto_id;
+            Tuple ordered as CRYPTO_COLUMNS
         """
-        
-        crypto_id = record['id']
-        symbol = record['symbol']
-        name = record['name']
-        image_url = record.get('image')
-        
-        self.cursor.execute(query, (crypto_id, symbol, name, image_url))
-        return self.cursor.fetchone()[0]
+        return (
+            record['id'],
+            record['symbol'],
+            record['name'],
+            record.get('image'),
+        )
     
-    def insert_price_snapshot(
-        self, 
-        crypto_id: str, 
-        batch_id: int, 
-        record: Dict,
-        snapshot_time: datetime
-    ) -> Optional[int]:
+    @staticmethod
+    def _snapshot_row(record: Dict, snapshot_time: datetime) -> Tuple:
         """
-        Insert price snapshot (with deduplication).
+        Build a price_snapshots row from an API record.
         
         Args:
-            crypto_id: Cryptocurrency identifier
-            batch_id: Ingestion batch ID
             record: Price data from API
             snapshot_time: Normalized snapshot timestamp
             
         Returns:
-            snapshot_id if inserted, None if duplicate
-        """
-        query = """
-            INSERT INTO price_snapshots (
-                crypto_id, batch_id, current_price, high_24h, low_24h,
-                price_change_24h, price_change_pct_24h,
-                ath, ath_change_pct, ath_date,
-                atl, atl_change_pct, atl_date,
-                last_updated, snapshot_time
-            )
-            VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-            )
-            ON CONFLICT (crypto_id, snapshot_time) DO NOTHING
-            RETURNING snapshot_id;
+            Tuple ordered as SNAPSHOT_COLUMNS
         """
+        # Bind the lookup once; the row below needs a dozen optional fields
+        get = record.get
         
-        # Parse datetime strings
-        last_updated = datetime.fromisoformat(
-            record['last_updated'].replace('Z', '+00:00')
-        )
-        ath_date = datetime.fromisoformat(
-            record['ath_date'].replace('Z', '+00:00')
-        ) if record.get('ath_date') else None
-        atl_date = datetime.fromisoformat(
-            record['atl_date'].replace('Z', '+00:00')
-        ) if record.get('atl_date') else None
-        
-        self.cursor.execute(query, (
-            crypto_id,
-            batch_id,
+        # ISO-8601 strings go to COPY as-is and the server's TIMESTAMP input
+        # parses them. It drops the 'Z' suffix, so the UTC wall-clock time is
+        # stored whatever the session TimeZone (matching ingested_at)
+        last_updated = record['last_updated']
+        ath_date = get('ath_date') or None
+        atl_date = get('atl_date') or None
+        
+        return (
+            record['id'],
             record['current_price'],
-            record.get('high_24h'),
-            record.get('low_24h'),
-            record.get('price_change_24h'),
-            record.get('price_change_percentage_24h'),
-            record.get('ath'),
-            record.get('ath_change_percentage'),
+            get('high_24h'),
+            get('low_24h'),
+            get('price_change_24h'),
+            get('price_change_percentage_24h'),
+            get('ath'),
+            get('ath_change_percentage'),
             ath_date,
-            record.get('atl'),
-            record.get('atl_change_percentage'),
+            get('atl'),
+            get('atl_change_percentage'),
             atl_date,
             last_updated,
             snapshot_time
-        ))
-        
-        result = self.cursor.fetchone()
-        if result:
-            return result[0]
-        else:
-            logger.debug(
-                f"Duplicate snapshot for {crypto_id} at {snapshot_time} - skipped"
-            )
-            return None
+        )
+    
+    # Kept as an attribute for callers of CryptoDataLoader.validate_record
+    validate_record = staticmethod(validate_record)
     
     @staticmethod
-    def validate_record(record: Dict):
-        """Validate inbound record for data quality compliance."""
-        _validate_required_strings(record, ['id', 'symbol', 'name'])
-        _validate_positive(record.get('current_price'), 'current_price', allow_zero=False)
-        for field in ['high_24h', 'low_24h', 'ath', 'atl']:
-            _validate_positive(record.get(field), field)
-        for field in ['market_cap', 'fully_diluted_valuation', 'total_volume', 'circulating_supply', 'total_supply', 'max_supply']:
-            _validate_positive(record.get(field), field)
-        rank = record.get('market_cap_rank')
-        if rank is not None and rank <= 0:
-            raise DataQualityError(f"market_cap_rank must be greater than zero (found {rank})")
-
-    def insert_market_metrics(self, snapshot_id: int, record: Dict):
+    def _metrics_row(record: Dict) -> Tuple:
         """
-        Insert market metrics for a price snapshot.
+        Build a staged market_metrics row from an API record.
+        
+        The row is keyed by crypto_id; snapshot_id is resolved server-side
+        once the matching price snapshot has been inserted.
         
         Args:
-            snapshot_id: Associated price snapshot ID
             record: Market data from API
+            
+        Returns:
+            Tuple ordered as METRICS_STAGE_COLUMNS
         """
-        query = """
-            INSERT INTO market_metrics (
-                snapshot_id, market_cap, market_cap_rank,
-                fully_diluted_valuation, total_volume,
-                market_cap_change_24h, market_cap_change_pct_24h,
-                circulating_supply, total_supply, max_supply,
-                roi_times, roi_currency, roi_percentage
-            )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s);
-        """
+        get = record.get
         
         # Handle ROI (can be null or dict)
-        roi = record.get('roi')
+        roi = get('roi')
         roi_times = roi.get('times') if roi else None
         roi_currency = roi.get('currency') if roi else None
         roi_percentage = roi.get('percentage') if roi else None
         
-        self.cursor.execute(query, (
-            snapshot_id,
-            record.get('market_cap'),
-            record.get('market_cap_rank'),
-            record.get('fully_diluted_valuation'),
-            record.get('total_volume'),
-            record.get('market_cap_change_24h'),
-            record.get('market_cap_change_percentage_24h'),
-            record.get('circulating_supply'),
-            record.get('total_supply'),
-            record.get('max_supply'),
+        return (
+            record['id'],
+            _as_bigint(get('market_cap')),
+            get('market_cap_rank'),
+            _as_bigint(get('fully_diluted_valuation')),
+            _as_bigint(get('total_volume')),
+            _as_bigint(get('market_cap_change_24h')),
+            get('market_cap_change_percentage_24h'),
+            get('circulating_supply'),
+            get('total_supply'),
+            get('max_supply'),
             roi_times,
             roi_currency,
             roi_percentage
-        ))
+        )
+    
+    @classmethod
+    def _prepare_rows(
+        cls,
+        records: List[Dict],
+        snapshot_time: datetime
+    ) -> Tuple[List[Tuple], List[Tuple], List[Tuple], int, int]:
+        """
+        Validate records and build staging rows, without touching the database.
+        
+        Args:
+            records: Raw records from the landing-zone file
+            snapshot_time: Normalized snapshot timestamp shared by the batch
+            
+        Returns:
+            Tuple of (crypto_rows, snapshot_rows, metrics_rows,
+            duplicates_skipped, dq_failures)
+        """
+        crypto_rows = []
+        snapshot_rows = []
+        metrics_rows = []
+        seen_ids = set()
+        skipped_count = 0
+        dq_failures = 0
+        
+        for record in records:
+            try:
+                validate_record(record)
+            except DataQualityError as dq_err:
+                dq_failures += 1
+                logger.warning(
+                    "Data quality failure for crypto_id=%s: %s", record.get('id'), dq_err
+                )
+                continue
+            
+            # All records in a file share snapshot_time, so a repeated id is a duplicate
+            if record['id'] in seen_ids:
+                skipped_count += 1
+                logger.debug(
+                    "Duplicate snapshot for %s at %s - skipped", record['id'], snapshot_time
+                )
+                continue
+            seen_ids.add(record['id'])
+            
+            crypto_rows.append(cls._crypto_row(record))
+            snapshot_rows.append(cls._snapshot_row(record, snapshot_time))
+            metrics_rows.append(cls._metrics_row(record))
+        
+        # snapshot_time is shared by the batch, so ordering by crypto_id stages
+        # rows in (crypto_id, snapshot_time) index order for local B-tree inserts
+        for rows in (crypto_rows, snapshot_rows, metrics_rows):
+            rows.sort(key=itemgetter(0))
+        
+        return crypto_rows, snapshot_rows, metrics_rows, skipped_count, dq_failures
+    
+    def _copy_stage(self, staging: str, columns: Sequence[str], csv_data: str):
+        """
+        Bulk-load CSV rows into a session staging table via COPY.
+        
+        Args:
+            staging: Staging table name (see STAGING_TABLES)
+            columns: Staged column names, matching the CSV field order
+            csv_data: Rows rendered by _render_csv
+        """
+        self.cursor.copy_expert(
+            f"COPY {staging} ({', '.join(columns)}) FROM STDIN "
+            f"WITH (FORMAT CSV, NULL '{_COPY_NULL}')",
+            io.StringIO(csv_data)
+        )
     
     def update_batch_status(self, batch_id: int, status: str):
         """
@@ -324,6 +496,10 @@ class CryptoDataLoader:
         """
         Load data from a JSON file into the database.
         
+        Records are validated and transformed in Python, streamed into
+        session staging tables with COPY, then merged into the target
+        tables with one set-based statement per table.
+        
         Args:
             file_path: Path to JSON file
             
@@ -331,56 +507,55 @@ class CryptoDataLoader:
             Tuple of (batch_id, records_loaded)
         """
         logger.info(f"Loading data from {file_path}")
+        return self._load_staged(_stage_file(file_path))
+    
+    def _load_staged(self, staged: Dict) -> Tuple[int, int]:
+        """
+        Write one staged file (see _stage_file) to the database as a batch.
         
-        # Read JSON file
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-        
-        ingested_at = datetime.fromisoformat(
-            data['ingested_at'].replace('Z', '+00:00')
-        )
-        source = data['source']
-        records = data['records']
-        record_count = len(records)
+        Args:
+            staged: Output of _stage_file
+            
+        Returns:
+            Tuple of (batch_id, records_loaded)
+        """
+        skipped_count = staged['skipped_count']
         
         try:
+            if os.getenv(FAST_COMMIT_ENV_VAR):
+                # Transaction-scoped: a crash may lose recently acknowledged
+                # batches, but never leaves them half-written
+                self.cursor.execute("SET LOCAL synchronous_commit = off;")
+            
             # Create batch
             batch_id = self.create_ingestion_batch(
-                ingested_at, source, record_count
+                staged['ingested_at'], staged['source'], staged['record_count']
             )
             
-            # Calculate snapshot time (rounded for deduplication)
-            snapshot_time = self.round_to_snapshot_interval(ingested_at)
-            
             loaded_count = 0
-            skipped_count = 0
-            dq_failures = 0
-            
-            # Process each record
-            for record in records:
-                try:
-                    self.validate_record(record)
-                except DataQualityError as dq_err:
-                    dq_failures += 1
-                    logger.warning(
-                        "Data quality failure for crypto_id=%s: %s", record.get('id'), dq_err
-                    )
-                    continue
-
-                # Upsert cryptocurrency
-                crypto_id = self.upsert_cryptocurrency(record)
+            if staged['crypto_ids']:
+                for staging, columns, csv_data in staged['copy_data']:
+                    self._copy_stage(staging, columns, csv_data)
                 
-                # Insert price snapshot
-                snapshot_id = self.insert_price_snapshot(
-                    crypto_id, batch_id, record, snapshot_time
+                # Upsert cryptocurrency master data, then insert price snapshots
+                # (with deduplication) and their market metrics. Both statements
+                # go out in one round-trip; psycopg2 exposes the result of the
+                # last one (the crypto_ids actually inserted).
+                self.cursor.execute(
+                    "EXECUTE upsert_cryptocurrencies; "
+                    "EXECUTE insert_snapshots_and_metrics (%s);",
+                    (batch_id,),
                 )
+                inserted_ids = {row[0] for row in self.cursor.fetchall()}
+                loaded_count = len(inserted_ids)
                 
-                if snapshot_id:
-                    # Insert market metrics
-                    self.insert_market_metrics(snapshot_id, record)
-                    loaded_count += 1
-                else:
+                for crypto_id in set(staged['crypto_ids']) - inserted_ids:
                     skipped_count += 1
+                    logger.debug(
+                        "Duplicate snapshot for %s at %s - skipped",
+                        crypto_id,
+                        staged['snapshot_time'],
+                    )
             
             # Update batch status
             self.update_batch_status(batch_id, 'completed')
@@ -393,7 +568,7 @@ class CryptoDataLoader:
                 batch_id,
                 loaded_count,
                 skipped_count,
-                dq_failures,
+                staged['dq_failures'],
             )
             
             return batch_id, loaded_count
@@ -408,7 +583,12 @@ class CryptoDataLoader:
     
     def load_directory(self, directory_path: Path) -> List[Tuple[int, int]]:
         """
-        Load all JSON files from a directory.
+        Load all JSON files (plain or gzip-compressed) from a directory.
+        
+        Larger directories are parsed and validated in worker processes, with
+        at most MAX_PENDING_PER_WORKER files per worker staged ahead of the
+        loader; this process holds the only database connection and loads the
+        staged results one batch at a time, in directory scan order.
         
         Args:
             directory_path: Path to directory containing JSON files
@@ -416,22 +596,158 @@ class CryptoDataLoader:
         Returns:
             List of (batch_id, records_loaded) tuples
         """
-        results = []
-        json_files = list(directory_path.glob('*.json'))
+        json_files = _iter_json(directory_path)
+        head = list(islice(json_files, MIN_PARALLEL_FILES))
         
-        logger.info(f"Found {len(json_files)} JSON files in {directory_path}")
+        # A few small files parse faster than worker processes start
+        if len(head) < MIN_PARALLEL_FILES:
+            return self._load_files(directory_path, _stage_inline(head))
         
-        for json_file in json_files:
+        workers = os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            staged_files = _stage_in_pool(
+                executor, chain(head, json_files), workers * MAX_PENDING_PER_WORKER
+            )
+            return self._load_files(directory_path, staged_files)
+    
+    def _load_files(
+        self, 
+        directory_path: Path, 
+        staged_files: Iterator[Tuple[Path, Callable[[], Dict]]]
+    ) -> List[Tuple[int, int]]:
+        """
+        Load staged files one batch at a time, logging and skipping failures.
+        
+        Args:
+            directory_path: Directory the files were found in
+            staged_files: (path, callable returning _stage_file output) pairs
+            
+        Returns:
+            List of (batch_id, records_loaded) tuples
+        """
+        results = []
+        file_count = 0
+        
+        for json_file, get_staged in staged_files:
+            file_count += 1
             try:
-                result = self.load_json_file(json_file)
+                logger.info(f"Loading data from {json_file}")
+                result = self._load_staged(get_staged())
                 results.append(result)
             except Exception as e:
                 logger.error(f"Failed to load {json_file}: {e}")
                 continue
         
+        logger.info("Processed %d JSON files in %s", file_count, directory_path)
         return results
 
 
+def _iter_json(directory_path: Path) -> Iterator[Path]:
+    """Yield the plain and gzip-compressed JSON files in a directory, unsorted."""
+    try:
+        entries = os.scandir(directory_path)
+    except FileNotFoundError:
+        # Same as the Path.glob() scan this replaced: a missing directory is empty
+        return
+    with entries:
+        for entry in entries:
+            if entry.name.endswith(('.json', '.json.gz')) and entry.is_file():
+                yield Path(entry.path)
+
+
+def _stage_inline(json_files: List[Path]) -> Iterator[Tuple[Path, Callable[[], Dict]]]:
+    """Pair each file with a callable that stages it in this process."""
+    for json_file in json_files:
+        yield json_file, functools.partial(_stage_file, json_file)
+
+
+def _stage_in_pool(
+    executor: ProcessPoolExecutor, 
+    json_files: Iterator[Path], 
+    window: int
+) -> Iterator[Tuple[Path, Callable[[], Dict]]]:
+    """
+    Stage files in worker processes, keeping at most `window` files in flight.
+    
+    Futures are released as soon as they are yielded, so only the staged
+    payloads inside the window are held in memory at once.
+    
+    Args:
+        executor: Pool running _stage_file
+        json_files: Files to stage, consumed lazily
+        window: Maximum number of submitted, not yet yielded files
+        
+    Yields:
+        (path, future.result) pairs in submission order
+    """
+    pending = deque()
+    for json_file in json_files:
+        pending.append((json_file, executor.submit(_stage_file, json_file)))
+        if len(pending) >= window:
+            json_file, future = pending.popleft()
+            yield json_file, future.result
+    while pending:
+        json_file, future = pending.popleft()
+        yield json_file, future.result
+
+
+def _render_csv(rows: List[Tuple]) -> str:
+    """Render row tuples as CSV text for COPY ... FROM STDIN, with None as _COPY_NULL."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(
+        [_COPY_NULL if value is None else value for value in row] for row in rows
+    )
+    return buffer.getvalue()
+
+
+def _stage_file(file_path: Path) -> Dict:
+    """
+    Read, validate and transform one landing-zone file into COPY-ready data.
+    
+    Needs no database handle, so load_directory can run it in worker processes.
+    
+    Args:
+        file_path: Path to JSON file (optionally gzip-compressed)
+        
+    Returns:
+        Dict with batch metadata, per-file counts and CSV text per staging table
+    """
+    # Read JSON file (gzip-compressed landing files are decompressed on the fly);
+    # callers may pass str paths, as open() always accepted them
+    opener = gzip.open if str(file_path).endswith('.gz') else open
+    with opener(file_path, 'rb') as f:
+        data = _json_loads(f.read())
+    
+    ingested_at = _parse_iso_timestamp(data['ingested_at'])
+    if ingested_at.tzinfo is not None:
+        # Bind naive UTC: psycopg2 sends aware datetimes as timestamptz, which
+        # the TIMESTAMP parameter would shift into the session's TimeZone
+        ingested_at = ingested_at.astimezone(timezone.utc).replace(tzinfo=None)
+    records = data['records']
+    
+    # Calculate snapshot time (rounded for deduplication)
+    snapshot_time = CryptoDataLoader.round_to_snapshot_interval(ingested_at)
+    
+    crypto_rows, snapshot_rows, metrics_rows, skipped_count, dq_failures = (
+        CryptoDataLoader._prepare_rows(records, snapshot_time)
+    )
+    
+    return {
+        'ingested_at': ingested_at,
+        'source': data['source'],
+        'record_count': len(records),
+        'snapshot_time': snapshot_time,
+        'crypto_ids': [row[0] for row in crypto_rows],
+        'skipped_count': skipped_count,
+        'dq_failures': dq_failures,
+        'copy_data': (
+            ('stg_cryptocurrencies', CRYPTO_COLUMNS, _render_csv(crypto_rows)),
+            ('stg_price_snapshots', SNAPSHOT_COLUMNS, _render_csv(snapshot_rows)),
+            ('stg_market_metrics', METRICS_STAGE_COLUMNS, _render_csv(metrics_rows)),
+        ),
+    }
+
+
 def main():
     """Main execution function."""
     
@@ -447,8 +763,8 @@ def main():
     if not conn_params['password']:
         raise ValueError('DB_PASSWORD environment variable must be set to load data.')
     
-    # Input file path
-    input_file = Path('landing_zone/crypto_prices_sample.json')
+    # Input file path: whichever file ingest.py wrote (plain or .json.gz)
+    input_file = Path(landing_file())
     
     # Load data
     with CryptoDataLoader(conn_params) as loader:
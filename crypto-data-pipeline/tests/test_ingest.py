@@ -0,0 +1,166 @@
+"""Tests for ingest's page merging, retry logging and landing-zone writes (no external network)."""
+
+import gzip
+import io
+import json
+import logging
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+import ingest
+
+
+class _FakeResponse:
+    """Streamed response stand-in exposing only what main() reads."""
+
+    def __init__(self, body: bytes):
+        self.raw = io.BytesIO(body)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+@pytest.fixture
+def landing_dir(tmp_path, monkeypatch):
+    """Run main() inside a scratch directory with the gzip option unset."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv(ingest.COMPRESS_ENV_VAR, raising=False)
+    monkeypatch.delenv(ingest.PAGES_ENV_VAR, raising=False)
+    monkeypatch.setattr(
+        ingest, 'fetch_crypto_data', lambda: _FakeResponse(b'[{"id": "bitcoin"}]')
+    )
+    return tmp_path / ingest.OUTPUT_DIR
+
+
+def _read_landing_file(path) -> dict:
+    opener = gzip.open if str(path).endswith('.gz') else open
+    with opener(path, 'rb') as f:
+        return json.loads(f.read())
+
+
+def _fetch_pages(monkeypatch, bodies):
+    """Run fetch_all_pages with each page URL answered from `bodies` in order."""
+    by_url = {
+        f"{ingest._PAGED_URL_PREFIX}{page}": body
+        for page, body in enumerate(bodies, start=1)
+    }
+    monkeypatch.setattr(ingest, '_get_session', lambda: None)
+    monkeypatch.setattr(ingest, '_fetch_page', lambda session, url: by_url[url])
+    return json.loads(ingest.fetch_all_pages(len(bodies)))
+
+
+@pytest.mark.parametrize('bodies, expected', [
+    ([b'[]', b'[]'], []),
+    ([b'[{"id": "a"}]', b'[]'], [{'id': 'a'}]),
+    ([b'[]', b' [ {"id": "a"} ]\n'], [{'id': 'a'}]),
+    (
+        [b'[{"id": "a"},{"id": "b"}]', b'[]', b'[\n  {"id": "c", "tags": [1, 2]}\n]'],
+        [{'id': 'a'}, {'id': 'b'}, {'id': 'c', 'tags': [1, 2]}],
+    ),
+])
+def test_fetch_all_pages_merges_arrays(monkeypatch, bodies, expected):
+    assert _fetch_pages(monkeypatch, bodies) == expected
+
+
+def test_paged_urls_drop_pinned_ids():
+    assert 'ids=' not in ingest._PAGED_URL_PREFIX
+    assert 'ids=' in ingest._FULL_URL
+
+
+def test_main_writes_envelope(landing_dir):
+    ingest.main()
+
+    assert os.listdir(landing_dir) == ['crypto_prices_sample.json']
+    data = _read_landing_file(landing_dir / 'crypto_prices_sample.json')
+    assert data['source'] == 'CoinGecko'
+    assert data['records'] == [{'id': 'bitcoin'}]
+    assert data['ingested_at'].endswith('Z')
+
+
+def test_main_uses_merged_pages(landing_dir, monkeypatch):
+    monkeypatch.setenv(ingest.PAGES_ENV_VAR, '2')
+    monkeypatch.setattr(ingest, 'fetch_all_pages', lambda pages: b'[{"id": "a"},{"id": "b"}]')
+
+    ingest.main()
+
+    data = _read_landing_file(landing_dir / 'crypto_prices_sample.json')
+    assert data['records'] == [{'id': 'a'}, {'id': 'b'}]
+
+
+def test_main_leaves_one_landing_file_per_format(landing_dir, monkeypatch):
+    ingest.main()
+
+    monkeypatch.setenv(ingest.COMPRESS_ENV_VAR, '1')
+    ingest.main()
+    assert os.listdir(landing_dir) == ['crypto_prices_sample.json.gz']
+    assert ingest.landing_file() == os.path.join('landing_zone', 'crypto_prices_sample.json.gz')
+    assert _read_landing_file(landing_dir / 'crypto_prices_sample.json.gz')['records'] == [
+        {'id': 'bitcoin'}
+    ]
+
+    monkeypatch.delenv(ingest.COMPRESS_ENV_VAR)
+    ingest.main()
+    assert os.listdir(landing_dir) == ['crypto_prices_sample.json']
+
+
+def test_main_keeps_previous_file_when_fetch_fails(landing_dir, monkeypatch):
+    ingest.main()
+
+    def failing_fetch():
+        raise ConnectionError('boom')
+
+    monkeypatch.setattr(ingest, 'fetch_crypto_data', failing_fetch)
+    with pytest.raises(ConnectionError):
+        ingest.main()
+
+    # The temp file is removed and the last good landing file is untouched
+    assert os.listdir(landing_dir) == ['crypto_prices_sample.json']
+    assert _read_landing_file(landing_dir / 'crypto_prices_sample.json')['records'] == [
+        {'id': 'bitcoin'}
+    ]
+
+
+def test_fetch_logs_each_failed_attempt(monkeypatch, caplog):
+    statuses = [429, 503, 200]
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            status = statuses.pop(0)
+            body = b'[{"id": "bitcoin"}]' if status == 200 else b''
+            self.send_response(status)
+            if status == 429:
+                self.send_header('Retry-After', '0')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(ingest, 'RETRY_BACKOFF', 0)
+    monkeypatch.setattr(ingest, '_FULL_URL', f"http://127.0.0.1:{server.server_port}/")
+    ingest._get_session.cache_clear()
+    try:
+        session = ingest._get_session()
+        # Route the plain-HTTP test server through the retrying adapter
+        session.mount('http://', session.get_adapter('https://'))
+        with caplog.at_level(logging.INFO, logger='ingest'):
+            with ingest.fetch_crypto_data() as response:
+                assert json.loads(response.raw.read()) == [{'id': 'bitcoin'}]
+    finally:
+        server.shutdown()
+        server.server_close()
+        ingest._get_session.cache_clear()
+
+    assert [r.getMessage() for r in caplog.records if r.levelno == logging.WARNING] == [
+        'Attempt 1 failed: rate limit hit (HTTP 429)',
+        'Attempt 2 failed: HTTP 503',
+    ]
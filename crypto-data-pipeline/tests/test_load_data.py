@@ -0,0 +1,205 @@
+"""Tests for the pure (database-free) parts of load_data."""
+
+import csv
+import gzip
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import ROUND_HALF_UP, Decimal
+
+import pytest
+
+from load_data import (
+    CRYPTO_COLUMNS,
+    METRICS_STAGE_COLUMNS,
+    SNAPSHOT_COLUMNS,
+    CryptoDataLoader,
+    DataQualityError,
+    _COPY_NULL,
+    _as_bigint,
+    _iter_json,
+    _render_csv,
+    _stage_file,
+    validate_record,
+)
+
+round_to_snapshot_interval = CryptoDataLoader.round_to_snapshot_interval
+
+
+def _sql_round_to_snapshot_interval(ts: datetime, interval_minutes: int) -> datetime:
+    """
+    Reference port of round_to_snapshot_interval() in sql/create_tables.sql:
+    date_trunc('hour', ts) + interval * ROUND(EXTRACT(MINUTE FROM ts)::NUMERIC / interval).
+    NUMERIC ROUND rounds half away from zero, i.e. half-up for minutes.
+    """
+    buckets = (Decimal(ts.minute) / Decimal(interval_minutes)).quantize(
+        Decimal(1), rounding=ROUND_HALF_UP
+    )
+    hour = ts.replace(minute=0, second=0, microsecond=0)
+    return hour + timedelta(minutes=int(buckets) * interval_minutes)
+
+
+def _record(crypto_id: str = 'bitcoin', **overrides) -> dict:
+    """Build a CoinGecko /coins/markets record."""
+    record = {
+        'id': crypto_id,
+        'symbol': crypto_id[:3],
+        'name': crypto_id.title(),
+        'image': None,
+        'current_price': 87829,
+        'market_cap': 1753331435138,
+        'market_cap_rank': 1,
+        'fully_diluted_valuation': 1753331435138,
+        'total_volume': 21094868730,
+        'high_24h': 88444,
+        'low_24h': 87241,
+        'price_change_24h': -65.55,
+        'price_change_percentage_24h': -0.07458,
+        'market_cap_change_24h': 121209571.6,
+        'market_cap_change_percentage_24h': 0.00691,
+        'circulating_supply': 19967075.0,
+        'total_supply': 19967075.0,
+        'max_supply': 21000000.0,
+        'ath': 126080,
+        'ath_change_percentage': -30.35,
+        'ath_date': '2025-10-06T18:57:42.558Z',
+        'atl': 67.81,
+        'atl_change_percentage': 129399.06,
+        'atl_date': '',
+        'roi': None,
+        'last_updated': '2025-12-25T22:36:53.024Z',
+    }
+    record.update(overrides)
+    return record
+
+
+@pytest.mark.parametrize('interval_minutes', range(1, 61))
+def test_round_to_snapshot_interval_matches_sql(interval_minutes):
+    for minute in range(60):
+        # Seconds are ignored, as EXTRACT(MINUTE ...) ignores them
+        for second, microsecond in ((0, 0), (59, 999999)):
+            ts = datetime(2025, 12, 25, 22, minute, second, microsecond)
+            assert round_to_snapshot_interval(ts, interval_minutes) == (
+                _sql_round_to_snapshot_interval(ts, interval_minutes)
+            ), ts
+
+
+def test_round_to_snapshot_interval_rolls_over_hour_and_day():
+    assert round_to_snapshot_interval(datetime(2025, 1, 1, 10, 58)) == datetime(2025, 1, 1, 11, 0)
+    assert round_to_snapshot_interval(datetime(2025, 12, 31, 23, 58)) == datetime(2026, 1, 1, 0, 0)
+    assert round_to_snapshot_interval(datetime(2025, 1, 1, 10, 2, 30)) == datetime(2025, 1, 1, 10, 0)
+    assert round_to_snapshot_interval(datetime(2025, 1, 1, 10, 3)) == datetime(2025, 1, 1, 10, 5)
+
+
+def test_round_to_snapshot_interval_converts_aware_input_to_naive_utc():
+    ts = datetime(2025, 1, 1, 10, 58, tzinfo=timezone(timedelta(hours=2)))
+    assert round_to_snapshot_interval(ts) == datetime(2025, 1, 1, 9, 0)
+    utc = datetime(2025, 1, 1, 10, 58, tzinfo=timezone.utc)
+    assert round_to_snapshot_interval(utc) == datetime(2025, 1, 1, 11, 0)
+
+
+@pytest.mark.parametrize('overrides, message', [
+    ({'symbol': ''}, "Missing required field 'symbol'"),
+    ({'current_price': 0}, 'current_price has invalid value 0'),
+    ({'ath': -1}, 'ath has invalid value -1'),
+    ({'market_cap_rank': 0}, 'market_cap_rank must be greater than zero'),
+])
+def test_validate_record_rejects(overrides, message):
+    with pytest.raises(DataQualityError, match=message):
+        validate_record(_record(**overrides))
+
+
+def test_validate_record_accepts_zero_and_missing_magnitudes():
+    validate_record(_record(ath=0, max_supply=None, market_cap_rank=None))
+
+
+def test_as_bigint_rounds_floats_only():
+    assert _as_bigint(121209571.6) == 121209572
+    assert isinstance(_as_bigint(121209571.6), int)
+    assert _as_bigint(1753331435138) == 1753331435138
+    assert _as_bigint(None) is None
+
+
+def test_render_csv_keeps_none_and_empty_string_distinct():
+    # COPY ... WITH (FORMAT CSV, NULL '\N') loads \N as NULL and an empty field as ''
+    text = _render_csv([('bitcoin', None, '', 'a "quoted", name', 1.5)])
+    assert text == 'bitcoin,\\N,,"a ""quoted"", name",1.5\r\n'
+    assert list(csv.reader(io.StringIO(text))) == [
+        ['bitcoin', _COPY_NULL, '', 'a "quoted", name', '1.5']
+    ]
+
+
+def test_empty_image_url_is_staged_as_empty_string():
+    crypto_rows = CryptoDataLoader._prepare_rows(
+        [_record('bitcoin', image=''), _record('solana')], datetime(2025, 12, 25, 22, 35)
+    )[0]
+    assert _render_csv(crypto_rows) == 'bitcoin,bit,Bitcoin,\r\nsolana,sol,Solana,\\N\r\n'
+
+
+def test_prepare_rows_counts_duplicates_and_quality_failures():
+    snapshot_time = datetime(2025, 12, 25, 22, 35)
+    records = [
+        _record('solana'),
+        _record('bitcoin'),
+        _record('ethereum', current_price=-3.5),
+        _record('bitcoin', current_price=1),
+        _record('cardano'),
+    ]
+
+    crypto_rows, snapshot_rows, metrics_rows, skipped, dq_failures = (
+        CryptoDataLoader._prepare_rows(records, snapshot_time)
+    )
+
+    assert (skipped, dq_failures) == (1, 1)
+    # Rows are staged sorted by crypto_id; the first bitcoin record wins
+    for rows in (crypto_rows, snapshot_rows, metrics_rows):
+        assert [row[0] for row in rows] == ['bitcoin', 'cardano', 'solana']
+    assert snapshot_rows[0][1] == 87829
+
+    assert all(len(row) == len(CRYPTO_COLUMNS) for row in crypto_rows)
+    assert all(len(row) == len(SNAPSHOT_COLUMNS) for row in snapshot_rows)
+    assert all(len(row) == len(METRICS_STAGE_COLUMNS) for row in metrics_rows)
+
+    snapshot = dict(zip(SNAPSHOT_COLUMNS, snapshot_rows[0]))
+    assert snapshot['snapshot_time'] == snapshot_time
+    assert snapshot['last_updated'] == '2025-12-25T22:36:53.024Z'
+    assert snapshot['atl_date'] is None
+
+    metrics = dict(zip(METRICS_STAGE_COLUMNS, metrics_rows[0]))
+    assert metrics['market_cap_change_24h'] == 121209572
+
+
+@pytest.mark.parametrize('compressed', [False, True])
+def test_stage_file_binds_ingested_at_as_naive_utc(tmp_path, compressed):
+    payload = json.dumps({
+        'ingested_at': '2025-12-25T23:58:10+01:00',
+        'source': 'CoinGecko',
+        'records': [_record('bitcoin'), _record('bitcoin')],
+    }).encode('utf-8')
+    if compressed:
+        file_path = tmp_path / 'prices.json.gz'
+        file_path.write_bytes(gzip.compress(payload))
+    else:
+        file_path = tmp_path / 'prices.json'
+        file_path.write_bytes(payload)
+
+    staged = _stage_file(file_path)
+    assert _stage_file(str(file_path)) == staged
+
+    assert staged['ingested_at'] == datetime(2025, 12, 25, 22, 58, 10)
+    assert staged['snapshot_time'] == datetime(2025, 12, 25, 23, 0)
+    assert staged['record_count'] == 2
+    assert staged['crypto_ids'] == ['bitcoin']
+    assert staged['skipped_count'] == 1
+    staging, columns, csv_data = staged['copy_data'][1]
+    assert (staging, columns) == ('stg_price_snapshots', SNAPSHOT_COLUMNS)
+    assert csv_data.count('\r\n') == 1
+
+
+def test_iter_json_yields_plain_and_gzip_files(tmp_path):
+    for name in ('a.json', 'b.json.gz', 'c.json.tmp', 'notes.txt'):
+        (tmp_path / name).write_bytes(b'')
+    (tmp_path / 'nested.json').mkdir()
+
+    assert sorted(path.name for path in _iter_json(tmp_path)) == ['a.json', 'b.json.gz']
+    assert list(_iter_json(tmp_path / 'missing')) == []